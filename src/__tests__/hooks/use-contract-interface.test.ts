@@ -0,0 +1,112 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { renderHook, waitFor, act } from '@testing-library/react';
+import {
+  useContractInterface,
+  clearContractInterfaceCache,
+  type ContractInterface,
+} from '@/hooks/use-contract-interface';
+
+const ADDRESS = 'SP2JXKMSH007NPYAQHKJPQMAQYAD90NQGTVJVQ02';
+
+const INTERFACE: ContractInterface = {
+  functions: [
+    { name: 'create-campaign', access: 'public', args: [], outputs: { type: 'bool' } },
+    { name: 'get-campaign', access: 'read_only', args: [], outputs: { type: 'bool' } },
+  ],
+  variables: [],
+  maps: [],
+  fungible_tokens: [],
+  non_fungible_tokens: [],
+  epoch: 'Epoch33',
+  clarity_version: 'Clarity4',
+};
+
+function okResponse(data: ContractInterface = INTERFACE) {
+  return { ok: true, json: async () => data };
+}
+
+/** A fetch mock whose responses are released by the test. */
+function deferredFetch() {
+  const resolvers: Array<(value: unknown) => void> = [];
+  const fetchMock = vi.fn(
+    () => new Promise((resolve) => {
+      resolvers.push(resolve);
+    }),
+  );
+  return { fetchMock, resolveNext: (value: unknown) => resolvers.shift()!(value) };
+}
+
+describe('useContractInterface', () => {
+  beforeEach(() => {
+    clearContractInterfaceCache();
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('shares one fetch between concurrent mounts', async () => {
+    const { fetchMock, resolveNext } = deferredFetch();
+    vi.stubGlobal('fetch', fetchMock);
+
+    const first = renderHook(() => useContractInterface('shared', ADDRESS));
+    const second = renderHook(() => useContractInterface('shared', ADDRESS));
+
+    await act(async () => resolveNext(okResponse()));
+
+    await waitFor(() => expect(first.result.current.interface).toEqual(INTERFACE));
+    await waitFor(() => expect(second.result.current.interface).toEqual(INTERFACE));
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('renders a cached interface on the first pass without loading', async () => {
+    const fetchMock = vi.fn().mockResolvedValue(okResponse());
+    vi.stubGlobal('fetch', fetchMock);
+
+    const first = renderHook(() => useContractInterface('cached', ADDRESS));
+    await waitFor(() => expect(first.result.current.interface).toEqual(INTERFACE));
+
+    const second = renderHook(() => useContractInterface('cached', ADDRESS));
+    expect(second.result.current.interface).toEqual(INTERFACE);
+    expect(second.result.current.loading).toBe(false);
+    expect(second.result.current.publicFunctions.map((f) => f.name)).toEqual(['create-campaign']);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('does not cache a fetch that was in flight when the cache was cleared', async () => {
+    const { fetchMock, resolveNext } = deferredFetch();
+    vi.stubGlobal('fetch', fetchMock);
+
+    const stale = renderHook(() => useContractInterface('cleared', ADDRESS));
+    clearContractInterfaceCache();
+    await act(async () => resolveNext(okResponse()));
+
+    // The mount that started the fetch still receives its result
+    await waitFor(() => expect(stale.result.current.interface).toEqual(INTERFACE));
+
+    const fresh = renderHook(() => useContractInterface('cleared', ADDRESS));
+    expect(fresh.result.current.interface).toBeNull();
+    await act(async () => resolveNext(okResponse()));
+    await waitFor(() => expect(fresh.result.current.interface).toEqual(INTERFACE));
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('does not cache a failed fetch', async () => {
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce({ ok: false, json: async () => ({}) })
+      .mockResolvedValueOnce(okResponse());
+    vi.stubGlobal('fetch', fetchMock);
+
+    const failed = renderHook(() => useContractInterface('missing', ADDRESS));
+    await waitFor(() =>
+      expect(failed.result.current.error).toBe(`Contract interface not found: ${ADDRESS}.missing`),
+    );
+    expect(failed.result.current.interface).toBeNull();
+
+    const retried = renderHook(() => useContractInterface('missing', ADDRESS));
+    await waitFor(() => expect(retried.result.current.interface).toEqual(INTERFACE));
+    expect(retried.result.current.error).toBeNull();
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,97 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import {
+  fetchBlockTime,
+  fetchBlockTimes,
+  seedBlockTimeCache,
+  clearBlockTimeCache,
+  MAX_CACHE_SIZE,
+  MAX_CONCURRENT_FETCHES,
+} from '@/lib/block-time-cache';
+
+describe('block-time-cache', () => {
+  beforeEach(() => {
+    clearBlockTimeCache();
+    vi.stubGlobal('fetch', vi.fn().mockRejectedValue(new Error('offline')));
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('serves seeded heights without fetching', async () => {
+    seedBlockTimeCache([[100, 1700000000]]);
+
+    await expect(fetchBlockTime(100)).resolves.toBe(1700000000);
+    expect(fetch).not.toHaveBeenCalled();
+  });
+
+  it('evicts the least recently used height when full', async () => {
+    seedBlockTimeCache(Array.from({ length: MAX_CACHE_SIZE }, (_, h) => [h, h] as [number, number]));
+
+    // Touch the oldest entry so height 1 becomes the eviction candidate
+    await fetchBlockTime(0);
+    seedBlockTimeCache([[MAX_CACHE_SIZE, MAX_CACHE_SIZE]]);
+
+    const times = await fetchBlockTimes([0, 1, MAX_CACHE_SIZE]);
+    expect(times.get(0)).toBe(0);
+    expect(times.has(1)).toBe(false);
+    expect(times.get(MAX_CACHE_SIZE)).toBe(MAX_CACHE_SIZE);
+  });
+
+  it('shares one request between concurrent lookups of a height', async () => {
+    const fetchMock = vi.fn().mockResolvedValue({
+      ok: true,
+      json: async () => ({ block_time: 1700000123 }),
+    });
+    vi.stubGlobal('fetch', fetchMock);
+
+    const [a, b] = await Promise.all([fetchBlockTime(42), fetchBlockTime(42)]);
+    expect(a).toBe(1700000123);
+    expect(b).toBe(1700000123);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('does not reuse or cache a request started before a clear', async () => {
+    let blockTime = 1700000001;
+    const fetchMock = vi.fn().mockImplementation(async () => {
+      const time = blockTime++;
+      return { ok: true, json: async () => ({ block_time: time }) };
+    });
+    vi.stubGlobal('fetch', fetchMock);
+
+    const stale = fetchBlockTime(7);
+    clearBlockTimeCache();
+    const fresh = fetchBlockTime(7);
+
+    await expect(stale).resolves.toBe(1700000001);
+    await expect(fresh).resolves.toBe(1700000002);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+
+    // Only the post-clear result is cached
+    await expect(fetchBlockTime(7)).resolves.toBe(1700000002);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('limits concurrent batch requests and fetches each height once', async () => {
+    let inFlight = 0;
+    let peak = 0;
+    const fetchMock = vi.fn(async (url: string) => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      // Hold the response open so the next requests overlap with this one
+      await new Promise((resolve) => setTimeout(resolve, 0));
+      inFlight--;
+      const height = Number(url.split('/').pop());
+      return { ok: true, json: async () => ({ block_time: height * 10 }) };
+    });
+    vi.stubGlobal('fetch', fetchMock);
+
+    const unique = Array.from({ length: MAX_CONCURRENT_FETCHES * 3 }, (_, i) => i + 1);
+    const times = await fetchBlockTimes([...unique, 1, 2, 3]);
+
+    expect(peak).toBe(MAX_CONCURRENT_FETCHES);
+    expect(fetchMock).toHaveBeenCalledTimes(unique.length);
+    expect(times.size).toBe(unique.length);
+    expect(times.get(3)).toBe(30);
+  });
+});
@@ -118,4 +118,17 @@ describe('movingAverage', () => {
   it('returns empty for empty input', () => {
     expect(movingAverage([], 7)).toEqual([]);
   });
+
+  it('drops points that slide out of the window', () => {
+    const data = [
+      { date: '2024-03-01', total: 10 },
+      { date: '2024-03-02', total: 20 },
+      { date: '2024-03-03', total: 30 },
+      { date: '2024-03-04', total: 40 },
+      { date: '2024-03-05', total: 50 },
+    ];
+    const result = movingAverage(data, 2);
+    expect(result.map((p) => p.average)).toEqual([10, 15, 25, 35, 45]);
+    expect(result.map((p) => p.date)).toEqual(data.map((d) => d.date));
+  });
 });
@@ -0,0 +1,104 @@
+import { describe, it, expect } from 'vitest';
+import { decodeClarityHex, isOkResponse, isErrResponse } from '@/lib/clarity-decoder';
+
+describe('clarity-decoder', () => {
+  describe('hex input', () => {
+    it('decodes with or without a 0x prefix', () => {
+      const hex = '0100000000000000000000000000000005';
+
+      expect(decodeClarityHex(`0x${hex}`)).toEqual({ type: 'uint', value: 5n });
+      expect(decodeClarityHex(hex)).toEqual({ type: 'uint', value: 5n });
+    });
+
+    it('accepts upper and lower case digits', () => {
+      const lower = decodeClarityHex('0x01000000000000000000000000000000ab');
+      const upper = decodeClarityHex('0x01000000000000000000000000000000AB');
+
+      expect(lower).toEqual({ type: 'uint', value: 0xabn });
+      expect(upper).toEqual(lower);
+    });
+
+    it('rejects an invalid character with its position', () => {
+      expect(() => decodeClarityHex('0x01zz')).toThrow('Invalid hex character at position 4');
+      expect(() => decodeClarityHex('0g')).toThrow('Invalid hex character at position 0');
+    });
+
+    it('rejects odd-length input', () => {
+      expect(() => decodeClarityHex('0x010')).toThrow('Hex string must have even length');
+    });
+  });
+
+  describe('integers', () => {
+    const ff = (n: number) => 'ff'.repeat(n);
+    const zeros = (n: number) => '00'.repeat(n);
+
+    it('decodes int128 -1', () => {
+      expect(decodeClarityHex(`0x00${ff(16)}`)).toEqual({ type: 'int', value: -1n });
+    });
+
+    it('decodes the int128 minimum and maximum', () => {
+      expect(decodeClarityHex(`0x0080${zeros(15)}`)).toEqual({ type: 'int', value: -(2n ** 127n) });
+      expect(decodeClarityHex(`0x007f${ff(15)}`)).toEqual({ type: 'int', value: 2n ** 127n - 1n });
+    });
+
+    it('decodes the uint128 maximum', () => {
+      expect(decodeClarityHex(`0x01${ff(16)}`)).toEqual({ type: 'uint', value: 2n ** 128n - 1n });
+    });
+
+    it('reads length prefixes of 2^31 and above as unsigned', () => {
+      // A signed read would turn this into a negative length
+      expect(() => decodeClarityHex('0x0280000000')).toThrow(
+        'Cannot read 2147483648 bytes, only 0 remaining',
+      );
+    });
+  });
+
+  describe('isOkResponse / isErrResponse', () => {
+    const OK_UINT = '0x070100000000000000000000000000000001';
+    const ERR_UINT = '0x080100000000000000000000000000000001';
+
+    it('classifies ok and err responses', () => {
+      expect(isOkResponse(OK_UINT)).toBe(true);
+      expect(isErrResponse(OK_UINT)).toBe(false);
+      expect(isErrResponse(ERR_UINT)).toBe(true);
+      expect(isOkResponse(ERR_UINT)).toBe(false);
+      expect(isOkResponse(ERR_UINT.slice(2))).toBe(false);
+      expect(isErrResponse(ERR_UINT.slice(2))).toBe(true);
+    });
+
+    it('returns false for non-response values', () => {
+      expect(isOkResponse('0x03')).toBe(false);
+      expect(isErrResponse('0x03')).toBe(false);
+    });
+
+    it('throws for empty or non-hex input', () => {
+      expect(() => isOkResponse('')).toThrow('Unexpected end of Clarity value');
+      expect(() => isErrResponse('0x')).toThrow('Unexpected end of Clarity value');
+      expect(() => isOkResponse('zz07')).toThrow('Invalid hex character at position 0');
+    });
+
+    it('throws for truncated or corrupt payloads', () => {
+      expect(() => isOkResponse('0x07')).toThrow('Unexpected end of Clarity value');
+      expect(() => isErrResponse('0x0801ff')).toThrow('Cannot read 16 bytes, only 1 remaining');
+      expect(() => isOkResponse('0x07zz')).toThrow('Invalid hex character at position 4');
+    });
+  });
+
+  describe('lists', () => {
+    it('decodes list elements in order', () => {
+      expect(decodeClarityHex('0x0b000000020304')).toEqual({
+        type: 'list',
+        value: [
+          { type: 'bool', value: true },
+          { type: 'bool', value: false },
+        ],
+      });
+    });
+
+    it('rejects a count larger than the remaining payload before allocating', () => {
+      expect(() => decodeClarityHex('0x0bffffffff03')).toThrow(
+        'List length 4294967295 exceeds remaining 1 bytes',
+      );
+    });
+  });
+});
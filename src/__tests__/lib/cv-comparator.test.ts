@@ -0,0 +1,114 @@
+import { describe, it, expect } from 'vitest';
+import {
+  cvEqual,
+  cvCompare,
+  cvPrincipalEqual,
+  uintCV,
+  intCV,
+  boolCV,
+  noneCV,
+  someCV,
+  bufferCV,
+  stringAsciiCV,
+  stringUtf8CV,
+  standardPrincipalCV,
+  contractPrincipalCV,
+  listCV,
+  tupleCV,
+  responseOkCV,
+  responseErrCV,
+} from '@/lib/stacksjs';
+
+const ADDRESS = 'SP2JXKMSH007NPYAQHKJPQMAQYAD90NQGTVJVQ02';
+const OTHER_ADDRESS = 'SP000000000000000000002Q6VF78';
+
+describe('cv-comparator', () => {
+  describe('cvEqual', () => {
+    it('compares bigint-backed integers without throwing', () => {
+      expect(cvEqual(uintCV(2n ** 100n), uintCV(2n ** 100n))).toBe(true);
+      expect(cvEqual(intCV(-1n), intCV(-1n))).toBe(true);
+      expect(cvEqual(uintCV(1), uintCV(2))).toBe(false);
+    });
+
+    it('never treats different types as equal', () => {
+      expect(cvEqual(uintCV(1), intCV(1))).toBe(false);
+      expect(cvEqual(responseOkCV(uintCV(1)), responseErrCV(uintCV(1)))).toBe(false);
+      expect(cvEqual(stringAsciiCV('a'), stringUtf8CV('a'))).toBe(false);
+    });
+
+    it('compares buffers byte by byte', () => {
+      expect(cvEqual(bufferCV(new Uint8Array([1, 2])), bufferCV(new Uint8Array([1, 2])))).toBe(true);
+      expect(cvEqual(bufferCV(new Uint8Array([1, 2])), bufferCV(new Uint8Array([1, 3])))).toBe(false);
+      expect(cvEqual(bufferCV(new Uint8Array([1])), bufferCV(new Uint8Array([1, 0])))).toBe(false);
+    });
+
+    it('recurses into optionals, responses and lists', () => {
+      expect(cvEqual(someCV(uintCV(5)), someCV(uintCV(5)))).toBe(true);
+      expect(cvEqual(someCV(uintCV(5)), noneCV())).toBe(false);
+      expect(cvEqual(noneCV(), noneCV())).toBe(true);
+      expect(cvEqual(listCV([uintCV(1), uintCV(2)]), listCV([uintCV(1), uintCV(2)]))).toBe(true);
+      expect(cvEqual(listCV([uintCV(1), uintCV(2)]), listCV([uintCV(2), uintCV(1)]))).toBe(false);
+      expect(cvEqual(listCV([uintCV(1)]), listCV([uintCV(1), uintCV(1)]))).toBe(false);
+    });
+
+    it('ignores tuple key insertion order', () => {
+      const a = tupleCV({ id: uintCV(1), name: stringAsciiCV('x') });
+      const b = tupleCV({ name: stringAsciiCV('x'), id: uintCV(1) });
+
+      expect(cvEqual(a, b)).toBe(true);
+      expect(cvEqual(a, tupleCV({ id: uintCV(1) }))).toBe(false);
+      expect(cvEqual(a, tupleCV({ id: uintCV(1), label: stringAsciiCV('x') }))).toBe(false);
+    });
+  });
+
+  describe('cvCompare', () => {
+    it('orders values of different types by type tag', () => {
+      expect(cvCompare(boolCV(true), intCV(0))).toBe(-1);
+      expect(cvCompare(uintCV(0), intCV(100))).toBe(1);
+    });
+
+    it('orders integers numerically', () => {
+      expect(cvCompare(uintCV(2), uintCV(10))).toBe(-1);
+      expect(cvCompare(intCV(-5), intCV(3))).toBe(-1);
+      expect(cvCompare(uintCV(2n ** 127n), uintCV(2n ** 127n))).toBe(0);
+    });
+
+    it('orders buffers and lists lexicographically with shorter prefixes first', () => {
+      expect(cvCompare(bufferCV(new Uint8Array([1, 9])), bufferCV(new Uint8Array([2])))).toBe(-1);
+      expect(cvCompare(bufferCV(new Uint8Array([1])), bufferCV(new Uint8Array([1, 0])))).toBe(-1);
+      expect(cvCompare(listCV([uintCV(1), uintCV(3)]), listCV([uintCV(1), uintCV(2)]))).toBe(1);
+      expect(cvCompare(listCV([uintCV(1)]), listCV([uintCV(1), uintCV(0)]))).toBe(-1);
+    });
+
+    it('orders tuples by sorted key, then by value', () => {
+      const a = tupleCV({ b: uintCV(1), a: uintCV(2) });
+      const b = tupleCV({ a: uintCV(2), b: uintCV(1) });
+
+      expect(cvCompare(a, b)).toBe(0);
+      expect(cvCompare(tupleCV({ a: uintCV(1) }), tupleCV({ a: uintCV(2) }))).toBe(-1);
+      expect(cvCompare(tupleCV({ a: uintCV(9) }), tupleCV({ b: uintCV(0) }))).toBe(-1);
+    });
+
+    it('orders contract principals by address, then contract name', () => {
+      expect(cvCompare(contractPrincipalCV(ADDRESS, 'a'), contractPrincipalCV(ADDRESS, 'b'))).toBe(-1);
+      expect(cvCompare(contractPrincipalCV(ADDRESS, 'a'), contractPrincipalCV(OTHER_ADDRESS, 'a'))).toBe(1);
+    });
+  });
+
+  describe('cvPrincipalEqual', () => {
+    it('matches principals of the same kind, address and name', () => {
+      expect(cvPrincipalEqual(standardPrincipalCV(ADDRESS), standardPrincipalCV(ADDRESS))).toBe(true);
+      expect(
+        cvPrincipalEqual(contractPrincipalCV(ADDRESS, 'campaign'), contractPrincipalCV(ADDRESS, 'campaign')),
+      ).toBe(true);
+      expect(
+        cvPrincipalEqual(contractPrincipalCV(ADDRESS, 'campaign'), contractPrincipalCV(ADDRESS, 'escrow')),
+      ).toBe(false);
+    });
+
+    it('rejects mixed principal kinds and non-principals', () => {
+      expect(cvPrincipalEqual(standardPrincipalCV(ADDRESS), contractPrincipalCV(ADDRESS, 'campaign'))).toBe(false);
+      expect(cvPrincipalEqual(stringAsciiCV(ADDRESS), stringAsciiCV(ADDRESS))).toBe(false);
+    });
+  });
+});
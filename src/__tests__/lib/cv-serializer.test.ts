@@ -0,0 +1,33 @@
+import { describe, it, expect } from 'vitest';
+import { serializeIntCV, serializeUintCV, intCV, uintCV } from '@/lib/stacksjs';
+import { decodeClarityHex } from '@/lib/clarity-decoder';
+
+const INT128_MIN = -(2n ** 127n);
+const INT128_MAX = 2n ** 127n - 1n;
+
+describe('cv-serializer', () => {
+  describe('serializeIntCV', () => {
+    it('encodes -1 as all ones', () => {
+      expect(serializeIntCV(intCV(-1n))).toBe('00' + 'ff'.repeat(16));
+    });
+
+    it('encodes the int128 minimum and maximum', () => {
+      expect(serializeIntCV(intCV(INT128_MIN))).toBe('0080' + '00'.repeat(15));
+      expect(serializeIntCV(intCV(INT128_MAX))).toBe('007f' + 'ff'.repeat(15));
+    });
+
+    it('round-trips through decodeClarityHex', () => {
+      for (const value of [0n, 1n, -1n, -(2n ** 64n), 2n ** 64n, INT128_MIN, INT128_MAX]) {
+        expect(decodeClarityHex(serializeIntCV(intCV(value)))).toEqual({ type: 'int', value });
+      }
+    });
+  });
+
+  describe('serializeUintCV', () => {
+    it('round-trips through decodeClarityHex', () => {
+      for (const value of [0n, 5n, 2n ** 64n - 1n, 2n ** 128n - 1n]) {
+        expect(decodeClarityHex(serializeUintCV(uintCV(value)))).toEqual({ type: 'uint', value });
+      }
+    });
+  });
+});
@@ -0,0 +1,49 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { fetchSTXPrice, invalidatePriceCache } from '@/lib/stx-price';
+
+function priceResponse(usd: number) {
+  return {
+    ok: true,
+    json: async () => ({ blockstack: { usd, last_updated_at: 1700000000 } }),
+  };
+}
+
+describe('stx-price', () => {
+  beforeEach(() => {
+    invalidatePriceCache();
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('shares one request between concurrent callers and caches the result', async () => {
+    const fetchMock = vi.fn().mockResolvedValue(priceResponse(1.5));
+    vi.stubGlobal('fetch', fetchMock);
+
+    const [a, b] = await Promise.all([fetchSTXPrice(), fetchSTXPrice()]);
+    expect(a.usd).toBe(1.5);
+    expect(b).toBe(a);
+
+    await expect(fetchSTXPrice()).resolves.toBe(a);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('does not reuse or cache a request started before an invalidation', async () => {
+    let usd = 1;
+    const fetchMock = vi.fn().mockImplementation(async () => priceResponse(usd++));
+    vi.stubGlobal('fetch', fetchMock);
+
+    const stale = fetchSTXPrice();
+    invalidatePriceCache();
+    const fresh = fetchSTXPrice();
+
+    await expect(stale).resolves.toMatchObject({ usd: 1 });
+    await expect(fresh).resolves.toMatchObject({ usd: 2 });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+
+    // Only the post-invalidation price is cached
+    await expect(fetchSTXPrice()).resolves.toMatchObject({ usd: 2 });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+});
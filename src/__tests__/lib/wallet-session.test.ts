@@ -1,4 +1,5 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { webcrypto } from 'node:crypto';
 import {
   saveWalletSession,
   loadWalletSession,
@@ -6,6 +7,8 @@ import {
   clearWalletSession,
   updateSessionActivity,
   getSessionInfo,
+  createSessionSignature,
+  verifySessionSignature,
   type WalletSession,
 } from '@/lib/wallet-session';
 
@@ -127,4 +130,70 @@ describe('wallet-session', () => {
       expect(getSessionInfo()).toBeNull();
     });
   });
+
+  describe('createSessionSignature / verifySessionSignature', () => {
+    const address = 'SP2JXKMSH007NPYAQHKJPQMAQYAD90NQGTVJVQ02';
+
+    beforeEach(() => {
+      // jsdom does not expose SubtleCrypto; use Node's implementation
+      vi.stubGlobal('crypto', webcrypto);
+      vi.spyOn(console, 'error').mockImplementation(() => {});
+    });
+
+    afterEach(() => {
+      vi.restoreAllMocks();
+      vi.unstubAllGlobals();
+    });
+
+    async function sign(): Promise<{ timestamp: string; digest: string }> {
+      const signature = await createSessionSignature(address);
+      expect(signature).not.toBeNull();
+      const [timestamp, digest] = signature!.split(':') as [string, string];
+      return { timestamp, digest };
+    }
+
+    it('verifies a freshly created signature', async () => {
+      const signature = await createSessionSignature(address);
+
+      expect(signature).toMatch(/^\d+:[0-9a-f]{64}$/);
+      await expect(verifySessionSignature(address, signature!)).resolves.toBe(true);
+    });
+
+    it('rejects a signature for a different address', async () => {
+      const signature = await createSessionSignature(address);
+
+      await expect(
+        verifySessionSignature('SP000000000000000000002Q6VF78', signature!),
+      ).resolves.toBe(false);
+    });
+
+    it('rejects a tampered digest', async () => {
+      const { timestamp, digest } = await sign();
+      const tampered = digest.slice(0, -1) + (digest.endsWith('0') ? '1' : '0');
+
+      await expect(verifySessionSignature(address, `${timestamp}:${tampered}`)).resolves.toBe(false);
+    });
+
+    it('rejects a digest of the wrong length', async () => {
+      const { timestamp, digest } = await sign();
+
+      await expect(verifySessionSignature(address, `${timestamp}:${digest.slice(0, -2)}`)).resolves.toBe(false);
+      await expect(verifySessionSignature(address, `${timestamp}:${digest}00`)).resolves.toBe(false);
+    });
+
+    it('rejects an expired signature', async () => {
+      const signature = await createSessionSignature(address);
+      const now = Date.now();
+      vi.spyOn(Date, 'now').mockReturnValue(now + 31 * 24 * 60 * 60 * 1000);
+
+      await expect(verifySessionSignature(address, signature!)).resolves.toBe(false);
+    });
+
+    it('rejects prefixed or uppercase digests', async () => {
+      const { timestamp, digest } = await sign();
+
+      await expect(verifySessionSignature(address, `${timestamp}:0x${digest}`)).resolves.toBe(false);
+      await expect(verifySessionSignature(address, `${timestamp}:${digest.toUpperCase()}`)).resolves.toBe(false);
+    });
+  });
 });
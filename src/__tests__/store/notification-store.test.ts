@@ -1,4 +1,4 @@
-import { describe, it, expect, beforeEach } from 'vitest';
+import { describe, it, expect, beforeEach, vi } from 'vitest';
 import { useNotificationStore } from '@/store/notification-store';
 
 const sampleNotification = {
@@ -62,6 +62,18 @@ describe('notification-store', () => {
     }
 
     expect(useNotificationStore.getState().notifications).toHaveLength(50);
+    expect(useNotificationStore.getState().unreadCount).toBe(50);
+  });
+
+  it('markAsRead on an already-read notification leaves the count alone', () => {
+    useNotificationStore.getState().addNotification(sampleNotification);
+    const id = useNotificationStore.getState().notifications[0].id;
+
+    useNotificationStore.getState().markAsRead(id);
+    useNotificationStore.getState().markAsRead(id);
+    useNotificationStore.getState().markAsRead('missing');
+
+    expect(useNotificationStore.getState().unreadCount).toBe(0);
   });
 
   it('markAsRead marks a single notification as read', () => {
@@ -110,11 +122,28 @@ describe('notification-store', () => {
     expect(useNotificationStore.getState().unreadCount).toBe(0);
   });
 
-  it('persists notifications to localStorage', () => {
+  it('persists notifications to localStorage', async () => {
     useNotificationStore.getState().addNotification(sampleNotification);
+    await Promise.resolve();
 
     const stored = JSON.parse(localStorage.getItem('adstack_notifications') || '[]');
     expect(stored).toHaveLength(1);
     expect(stored[0].title).toBe('Transaction Confirmed');
   });
+
+  it('coalesces a burst of updates into one storage write', async () => {
+    const setItem = vi.spyOn(Storage.prototype, 'setItem');
+
+    useNotificationStore.getState().addNotification({ ...sampleNotification, title: 'A' });
+    useNotificationStore.getState().addNotification({ ...sampleNotification, title: 'B' });
+    useNotificationStore.getState().markAllAsRead();
+    expect(setItem).not.toHaveBeenCalled();
+
+    await Promise.resolve();
+
+    expect(setItem).toHaveBeenCalledTimes(1);
+    const stored = JSON.parse(localStorage.getItem('adstack_notifications') || '[]');
+    expect(stored.map((n: { title: string }) => n.title)).toEqual(['B', 'A']);
+    setItem.mockRestore();
+  });
 });
@@ -44,7 +44,7 @@ export {
 export { useDeployTime, useContractVersion } from './use-campaign';
 
 // Contract Introspection
-export { useContractInterface } from './use-contract-interface';
+export { useContractInterface, clearContractInterfaceCache } from './use-contract-interface';
 
 // Budget
 export { useBudgetTracker, useBudgetAlert } from './use-budget-tracker';
@@ -7,7 +7,7 @@
 
 'use client';
 
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useMemo } from 'react';
 import { fetchContractEvents } from '@/lib/hiro-api';
 import { decodeAdStackEvents, DecodedEvent } from '@/lib/event-decoder';
 import { getApiUrl, SupportedNetwork } from '@/lib/stacks-network';
@@ -79,17 +79,32 @@ export function useCampaignEvents(
     return () => clearInterval(interval);
   }, [fetchEvents, pollIntervalMs]);
 
-  const campaignCreatedEvents = events.filter(
-    (e) => e.event.event === 'campaign-created',
-  ) as DecodedEvent<OnChainCampaignCreatedEvent>[];
-
-  const fundsReleasedEvents = events.filter(
-    (e) => e.event.event === 'funds-released',
-  ) as DecodedEvent<OnChainFundsReleasedEvent>[];
+  // Split by event type in a single pass, only when the event list changes
+  const { campaignCreatedEvents, fundsReleasedEvents, fundsRefundedEvents } = useMemo(() => {
+    const created: DecodedEvent<OnChainCampaignCreatedEvent>[] = [];
+    const released: DecodedEvent<OnChainFundsReleasedEvent>[] = [];
+    const refunded: DecodedEvent<OnChainFundsRefundedEvent>[] = [];
+
+    for (const e of events) {
+      switch (e.event.event) {
+        case 'campaign-created':
+          created.push(e as DecodedEvent<OnChainCampaignCreatedEvent>);
+          break;
+        case 'funds-released':
+          released.push(e as DecodedEvent<OnChainFundsReleasedEvent>);
+          break;
+        case 'funds-refunded':
+          refunded.push(e as DecodedEvent<OnChainFundsRefundedEvent>);
+          break;
+      }
+    }
 
-  const fundsRefundedEvents = events.filter(
-    (e) => e.event.event === 'funds-refunded',
-  ) as DecodedEvent<OnChainFundsRefundedEvent>[];
+    return {
+      campaignCreatedEvents: created,
+      fundsReleasedEvents: released,
+      fundsRefundedEvents: refunded,
+    };
+  }, [events]);
 
   return {
     events,
@@ -102,21 +117,38 @@ export function useCampaignEvents(
   };
 }
 
+/** Shared empty result; frozen so no consumer can mutate it for the others. */
+const NO_EVENTS: readonly DecodedEvent[] = Object.freeze([]);
+
 /**
  * Hook to get events for a specific campaign ID.
+ * Events are indexed by campaign once per poll, so lookups (and changing
+ * the selected campaign) do not rescan the event list.
  */
 export function useCampaignEventsByCampaign(
   campaignId: number | undefined,
   network?: SupportedNetwork,
-): { events: DecodedEvent[]; loading: boolean } {
+): { events: readonly DecodedEvent[]; loading: boolean } {
   const { events, loading } = useCampaignEvents(60_000, 100, network);
 
+  const byCampaign = useMemo(() => {
+    const index = new Map<number, DecodedEvent[]>();
+    for (const e of events) {
+      const ev = e.event as any;
+      const id = Number(ev['campaign-id'] ?? ev['payout-id'] ?? -1);
+      const bucket = index.get(id);
+      if (bucket) {
+        bucket.push(e);
+      } else {
+        index.set(id, [e]);
+      }
+    }
+    return index;
+  }, [events]);
+
   const filtered = campaignId !== undefined
-    ? events.filter((e) => {
-        const ev = e.event as any;
-        return Number(ev['campaign-id'] ?? ev['payout-id'] ?? -1) === campaignId;
-      })
-    : [];
+    ? byCampaign.get(campaignId) ?? NO_EVENTS
+    : NO_EVENTS;
 
   return { events: filtered, loading };
 }
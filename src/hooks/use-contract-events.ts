@@ -129,6 +129,10 @@ export function useFilteredContractEvents({
 
       const parsed = parseEvents(result.data.results);
 
+      // Coerce the filter value once rather than per event
+      const numericFilter = Number(filterValue);
+      const stringFilter = String(filterValue);
+
       // Filter events whose decoded tuple has the matching field value
       return parsed.filter((event) => {
         if (!event.decoded || event.decoded.type !== 'tuple') return false;
@@ -136,13 +140,13 @@ export function useFilteredContractEvents({
         if (!field) return false;
 
         if (field.type === 'uint' || field.type === 'int') {
-          return Number(field.value) === Number(filterValue);
+          return Number(field.value) === numericFilter;
         }
         if (field.type === 'string-ascii' || field.type === 'string-utf8') {
-          return field.value === String(filterValue);
+          return field.value === stringFilter;
         }
         if (field.type === 'principal') {
-          return field.value === String(filterValue);
+          return field.value === stringFilter;
         }
         return false;
       });
@@ -6,7 +6,7 @@
 
 'use client';
 
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useMemo } from 'react';
 import { getApiUrl, SupportedNetwork } from '@/lib/stacks-network';
 import { CONTRACT_ADDRESS } from '@/lib/stacks-config';
 import type { ContractName } from '@/lib/stacks-config';
@@ -49,6 +49,62 @@ export interface ContractInterface {
   clarity_version: string;
 }
 
+// ---------------------------------------------------------------------------
+// Cache
+// ---------------------------------------------------------------------------
+
+/** Resolved interfaces keyed by `${apiUrl}/${address}.${contractName}`. */
+const interfaceCache = new Map<string, ContractInterface>();
+
+/** In-flight fetches, shared by every hook instance asking for the same key. */
+const pendingInterfaces = new Map<string, Promise<ContractInterface>>();
+
+/** Bumped on clear so fetches started before it do not repopulate the cache. */
+let cacheGeneration = 0;
+
+function interfaceKey(apiUrl: string, address: string, contractName: string): string {
+  return `${apiUrl}/${address}.${contractName}`;
+}
+
+function loadInterface(apiUrl: string, address: string, contractName: string): Promise<ContractInterface> {
+  const key = interfaceKey(apiUrl, address, contractName);
+  const cached = interfaceCache.get(key);
+  if (cached) return Promise.resolve(cached);
+
+  const pending = pendingInterfaces.get(key);
+  if (pending) return pending;
+
+  const generation = cacheGeneration;
+  const request: Promise<ContractInterface> = (async () => {
+    const response = await fetch(`${apiUrl}/v2/contracts/interface/${address}/${contractName}`);
+    if (!response.ok) {
+      throw new Error(`Contract interface not found: ${address}.${contractName}`);
+    }
+    const data: ContractInterface = await response.json();
+    if (generation === cacheGeneration) {
+      interfaceCache.set(key, data);
+    }
+    return data;
+  })().finally(() => {
+    if (pendingInterfaces.get(key) === request) {
+      pendingInterfaces.delete(key);
+    }
+  });
+
+  pendingInterfaces.set(key, request);
+  return request;
+}
+
+/**
+ * Drop cached and in-flight contract interfaces (e.g., after a redeploy
+ * on devnet). Hooks mounted afterwards fetch a fresh copy.
+ */
+export function clearContractInterfaceCache(): void {
+  interfaceCache.clear();
+  pendingInterfaces.clear();
+  cacheGeneration++;
+}
+
 // ---------------------------------------------------------------------------
 // Hook
 // ---------------------------------------------------------------------------
@@ -63,33 +119,37 @@ export interface ContractInterfaceState {
 
 /**
  * Hook to fetch and cache a contract's Clarity interface from Hiro API.
- * The interface is stable after deployment so caching is infinite.
+ * The interface is stable after deployment so caching is infinite: the
+ * result is kept in a module-level cache shared across mounts.
  */
 export function useContractInterface(
   contractName: ContractName | string,
   contractAddress?: string,
   network?: SupportedNetwork,
 ): ContractInterfaceState {
-  const [iface, setIface] = useState<ContractInterface | null>(null);
+  const address = contractAddress ?? CONTRACT_ADDRESS;
+
+  // Seed from the cache so a hit renders the interface on the first pass
+  const [iface, setIface] = useState<ContractInterface | null>(
+    () => interfaceCache.get(interfaceKey(getApiUrl(network), address, contractName)) ?? null,
+  );
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
-  const address = contractAddress ?? CONTRACT_ADDRESS;
-
   const fetchInterface = useCallback(async () => {
+    const apiUrl = getApiUrl(network);
+    const cached = interfaceCache.get(interfaceKey(apiUrl, address, contractName));
+    if (cached) {
+      setIface(cached);
+      setError(null);
+      return;
+    }
+
     setLoading(true);
     setError(null);
 
     try {
-      const apiUrl = getApiUrl(network);
-      const url = `${apiUrl}/v2/contracts/interface/${address}/${contractName}`;
-      const response = await fetch(url);
-
-      if (!response.ok) {
-        throw new Error(`Contract interface not found: ${address}.${contractName}`);
-      }
-
-      const data: ContractInterface = await response.json();
+      const data = await loadInterface(apiUrl, address, contractName);
       setIface(data);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to fetch interface');
@@ -102,8 +162,14 @@ export function useContractInterface(
     fetchInterface();
   }, [fetchInterface]);
 
-  const publicFunctions = iface?.functions.filter((f) => f.access === 'public') ?? [];
-  const readOnlyFunctions = iface?.functions.filter((f) => f.access === 'read_only') ?? [];
+  const publicFunctions = useMemo(
+    () => iface?.functions.filter((f) => f.access === 'public') ?? [],
+    [iface],
+  );
+  const readOnlyFunctions = useMemo(
+    () => iface?.functions.filter((f) => f.access === 'read_only') ?? [],
+    [iface],
+  );
 
   return {
     interface: iface,
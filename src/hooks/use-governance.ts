@@ -3,6 +3,7 @@
 import { useReadOnlyCall } from './use-read-only-call';
 import { CONTRACTS } from '@/lib/stacks-config';
 import { isValidStacksAddress } from '@/lib/address-validation';
+import { utf8ToHex } from '@/utils/hex-utils';
 
 /**
  * Encode a uint as a Clarity hex argument.
@@ -15,9 +16,7 @@ function encodeUintArg(value: number): string {
  * Encode a principal address for read-only calls.
  */
 function encodePrincipalArg(address: string): string {
-  const hex = Array.from(new TextEncoder().encode(address))
-    .map((b) => b.toString(16).padStart(2, '0'))
-    .join('');
+  const hex = utf8ToHex(address);
   const len = address.length.toString(16).padStart(8, '0');
   return `0x0d${len}${hex}`;
 }
@@ -74,10 +74,11 @@ export function useTransactionHistory(
 
         // Filter to AdStack contract calls if requested
         if (filterContractName) {
+          const contractId = `${CONTRACT_ADDRESS}.${filterContractName}`;
           results = results.filter((tx) => {
             if (tx.tx_type !== 'contract_call') return false;
             const call = (tx as ContractCallTransaction).contract_call;
-            const matchesContract = call.contract_id === `${CONTRACT_ADDRESS}.${filterContractName}`;
+            const matchesContract = call.contract_id === contractId;
             const matchesFunction = filterFunctionName
               ? call.function_name === filterFunctionName
               : true;
@@ -28,6 +28,31 @@ function normalizeStatus(apiStatus: string): TxStatus {
   return 'unknown';
 }
 
+/**
+ * Fetch a transaction and reduce it to a TxStatusInfo.
+ * Transactions the API has not indexed yet are reported as pending.
+ */
+async function fetchTxStatus(txId: string): Promise<TxStatusInfo> {
+  const result = await fetchTransaction(txId);
+
+  if (!result.ok || !result.data) {
+    // Transaction not yet indexed (still in mempool) - treat as pending
+    return { txId, status: 'pending', blockHeight: null, raw: null, isFinalized: false };
+  }
+
+  const tx = result.data;
+  const status = normalizeStatus(tx.tx_status);
+  const isFinalized = status !== 'pending' && status !== 'unknown' && status !== 'dropped';
+
+  return {
+    txId,
+    status,
+    blockHeight: isFinalized ? tx.block_height : null,
+    raw: tx,
+    isFinalized,
+  };
+}
+
 /**
  * Hook to poll transaction status until it confirms or fails.
  * Automatically stops polling once the transaction reaches a final state.
@@ -52,30 +77,7 @@ export function useTxStatus(txId: string | undefined, pollInterval = 5000) {
         return { txId: '', status: 'unknown', blockHeight: null, raw: null, isFinalized: false };
       }
 
-      const result = await fetchTransaction(txId);
-
-      if (!result.ok || !result.data) {
-        // Transaction not yet indexed (still in mempool) - treat as pending
-        return {
-          txId,
-          status: 'pending',
-          blockHeight: null,
-          raw: null,
-          isFinalized: false,
-        };
-      }
-
-      const tx = result.data;
-      const status = normalizeStatus(tx.tx_status);
-      const isFinalized = status !== 'pending' && status !== 'unknown' && status !== 'dropped';
-
-      return {
-        txId,
-        status,
-        blockHeight: isFinalized ? tx.block_height : null,
-        raw: tx,
-        isFinalized,
-      };
+      return fetchTxStatus(txId);
     },
     enabled: !!txId,
     staleTime: 3_000,
@@ -92,41 +94,27 @@ export function useTxStatus(txId: string | undefined, pollInterval = 5000) {
  * Hook to track multiple transaction statuses at once.
  * Returns a map of txId -> TxStatusInfo.
  *
+ * Entries that are already finalized are carried over from the previous
+ * result and never fetched again; only in-flight transactions are polled.
+ *
  * @param txIds - Array of transaction IDs to track
  */
 export function useBatchTxStatus(txIds: string[]) {
   const queryClient = useQueryClient();
 
-  const queries = txIds.map((txId) => ({
-    queryKey: ['tx-status', CURRENT_NETWORK, txId] as const,
-    queryFn: async (): Promise<TxStatusInfo> => {
-      const result = await fetchTransaction(txId);
-      if (!result.ok || !result.data) {
-        return { txId, status: 'pending' as TxStatus, blockHeight: null, raw: null, isFinalized: false };
-      }
-      const tx = result.data;
-      const status = normalizeStatus(tx.tx_status);
-      const isFinalized = status !== 'pending' && status !== 'unknown' && status !== 'dropped';
-      return { txId, status, blockHeight: isFinalized ? tx.block_height : null, raw: tx, isFinalized };
-    },
-  }));
+  const queryKey = ['batch-tx-status', CURRENT_NETWORK, ...txIds];
 
-  // Use individual useQuery calls but expose a combined interface
   const results = useQuery({
-    queryKey: ['batch-tx-status', CURRENT_NETWORK, ...txIds],
+    queryKey,
     queryFn: async () => {
+      // Finalized transactions cannot change, so each poll only
+      // re-fetches the ones that are still in flight
+      const previous = queryClient.getQueryData<Record<string, TxStatusInfo>>(queryKey);
       const statuses: Record<string, TxStatusInfo> = {};
       await Promise.all(
         txIds.map(async (txId) => {
-          const result = await fetchTransaction(txId);
-          if (!result.ok || !result.data) {
-            statuses[txId] = { txId, status: 'pending', blockHeight: null, raw: null, isFinalized: false };
-            return;
-          }
-          const tx = result.data;
-          const status = normalizeStatus(tx.tx_status);
-          const isFinalized = status !== 'pending' && status !== 'unknown' && status !== 'dropped';
-          statuses[txId] = { txId, status, blockHeight: isFinalized ? tx.block_height : null, raw: tx, isFinalized };
+          const known = previous?.[txId];
+          statuses[txId] = known?.isFinalized ? known : await fetchTxStatus(txId);
         }),
       );
       return statuses;
@@ -147,6 +135,11 @@ export function useBatchTxStatus(txIds: string[]) {
 
 /**
  * Manually invalidate a tx status query (e.g., when a new block arrives).
+ *
+ * Note: an invalidated batch query only re-fetches transactions that are
+ * not finalized yet, since useBatchTxStatus reuses finalized entries from
+ * its cached result. To force those to be fetched again, remove the query
+ * instead (queryClient.removeQueries({ queryKey: ['batch-tx-status'] })).
  */
 export function useInvalidateTxStatus() {
   const queryClient = useQueryClient();
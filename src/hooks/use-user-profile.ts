@@ -3,6 +3,7 @@
 import { useReadOnlyCall } from './use-read-only-call';
 import { CONTRACTS } from '@/lib/stacks-config';
 import { isValidStacksAddress } from '@/lib/address-validation';
+import { utf8ToHex } from '@/utils/hex-utils';
 
 /**
  * Encode a standard Stacks principal as hex for read-only calls.
@@ -15,9 +16,7 @@ import { isValidStacksAddress } from '@/lib/address-validation';
  * which works for contracts that accept (string-ascii) addresses.
  */
 function encodeAddressArg(address: string): string {
-  const hex = Array.from(new TextEncoder().encode(address))
-    .map((b) => b.toString(16).padStart(2, '0'))
-    .join('');
+  const hex = utf8ToHex(address);
   // Clarity string-ascii: type 0x0d + 4-byte length + content
   const len = (address.length).toString(16).padStart(8, '0');
   return `0x0d${len}${hex}`;
@@ -1,5 +1,6 @@
 // useContractWrite: submit a Clarity contract call transaction
 import { useState, useCallback } from 'react';
+import { STACKS_MAINNET, STACKS_TESTNET } from '@stacks/network';
 
 export type TxStatus = 'idle' | 'pending' | 'success' | 'error';
 
@@ -38,7 +39,7 @@ export function useContractWrite(params: ContractWriteParams) {
         functionName: merged.functionName,
         functionArgs: (merged.functionArgs as import('@stacks/transactions').ClarityValue[]) ?? [],
         postConditions: (merged.postConditions as import('@stacks/transactions').PostCondition[]) ?? [],
-        network: merged.network === 'testnet' ? new (await import('@stacks/network')).StacksTestnet() : new (await import('@stacks/network')).StacksMainnet(),
+        network: merged.network === 'testnet' ? STACKS_TESTNET : STACKS_MAINNET,
         onFinish: (data) => {
           setState({ txId: data.txId, status: 'success', error: null });
           merged.onFinish?.(data.txId);
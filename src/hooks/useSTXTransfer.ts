@@ -1,5 +1,6 @@
 // useSTXTransfer: initiate a STX transfer via Stacks Connect
 import { useState, useCallback } from 'react';
+import { STACKS_MAINNET, STACKS_TESTNET } from '@stacks/network';
 
 export interface STXTransferParams {
   recipient: string;
@@ -30,9 +31,7 @@ export function useSTXTransfer(defaultParams?: Partial<STXTransferParams>) {
         recipient: merged.recipient!,
         amount: merged.amount!,
         memo: merged.memo,
-        network: merged.network === 'testnet'
-          ? new (await import('@stacks/network')).StacksTestnet()
-          : new (await import('@stacks/network')).StacksMainnet(),
+        network: merged.network === 'testnet' ? STACKS_TESTNET : STACKS_MAINNET,
         onFinish: (data) => {
           setState({ txId: data.txId, status: 'success', error: null });
           merged.onFinish?.(data.txId);
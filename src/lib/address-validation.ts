@@ -10,6 +10,9 @@ const TESTNET_PREFIX = 'ST';
 /** Valid Crockford Base32 characters used in Stacks addresses. */
 const CROCKFORD_BASE32 = /^[0-9A-HJ-NP-TV-Z]+$/i;
 
+/** Contract names start with a letter, then alphanumerics, hyphens, underscores. */
+const CONTRACT_NAME_PATTERN = /^[a-zA-Z][a-zA-Z0-9_-]*$/;
+
 /**
  * Check if a string is a valid Stacks address format.
  * Validates prefix (SP/ST), length (between 38-42 chars), and character set.
@@ -64,7 +67,7 @@ export function isValidContractId(contractId: string): boolean {
 
   // Contract names: 1-128 chars, start with alpha, alphanumeric/hyphens/underscores
   if (!contractName || contractName.length === 0 || contractName.length > 128) return false;
-  if (!/^[a-zA-Z][a-zA-Z0-9_-]*$/.test(contractName)) return false;
+  if (!CONTRACT_NAME_PATTERN.test(contractName)) return false;
 
   return true;
 }
@@ -8,22 +8,49 @@
 import { getApiUrl, SupportedNetwork } from './stacks-network';
 
 // ---------------------------------------------------------------------------
-// In-Memory LRU-like Cache
+// In-Memory LRU Cache
 // ---------------------------------------------------------------------------
 
-const MAX_CACHE_SIZE = 500;
+/** Maximum number of heights kept before the least recently used is evicted. */
+export const MAX_CACHE_SIZE = 500;
+
+/** Maximum number of block requests in flight during a batch fetch. */
+export const MAX_CONCURRENT_FETCHES = 6;
+
+/** Map iteration order doubles as recency order: first key is least recent. */
 const blockTimeCache = new Map<number, number>();
 
+/** Requests in flight, so concurrent lookups of one height share a fetch. */
+const pendingBlockTimes = new Map<number, Promise<number>>();
+
+/** Bumped on clear so requests started before it do not repopulate the cache. */
+let cacheGeneration = 0;
+
 /**
- * Evict oldest entries if the cache exceeds capacity.
+ * Look up a cached block time, marking it most recently used.
  */
-function evictIfNeeded(): void {
+function getCached(height: number): number | undefined {
+  const time = blockTimeCache.get(height);
+  if (time !== undefined) {
+    blockTimeCache.delete(height);
+    blockTimeCache.set(height, time);
+  }
+  return time;
+}
+
+/**
+ * Store a block time as most recently used, evicting the least recently
+ * used entry when the cache is full.
+ */
+function setCached(height: number, time: number): void {
+  blockTimeCache.delete(height);
   if (blockTimeCache.size >= MAX_CACHE_SIZE) {
-    const firstKey = blockTimeCache.keys().next().value;
-    if (firstKey !== undefined) {
-      blockTimeCache.delete(firstKey);
+    const lruKey = blockTimeCache.keys().next().value;
+    if (lruKey !== undefined) {
+      blockTimeCache.delete(lruKey);
     }
   }
+  blockTimeCache.set(height, time);
 }
 
 // ---------------------------------------------------------------------------
@@ -32,16 +59,39 @@ function evictIfNeeded(): void {
 
 /**
  * Fetch the Unix timestamp for a specific Stacks block height.
- * Results are cached to avoid repeated API calls.
+ * Results are cached to avoid repeated API calls, and callers asking for
+ * a height that is already being fetched await the same request.
  */
 export async function fetchBlockTime(
   height: number,
   network?: SupportedNetwork,
 ): Promise<number> {
-  if (blockTimeCache.has(height)) {
-    return blockTimeCache.get(height)!;
+  const cached = getCached(height);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  let pending = pendingBlockTimes.get(height);
+  if (!pending) {
+    const request: Promise<number> = requestBlockTime(height, network).finally(() => {
+      if (pendingBlockTimes.get(height) === request) {
+        pendingBlockTimes.delete(height);
+      }
+    });
+    pendingBlockTimes.set(height, request);
+    pending = request;
   }
+  return pending;
+}
 
+/**
+ * Fetch a single block from the API and cache its timestamp.
+ */
+async function requestBlockTime(
+  height: number,
+  network?: SupportedNetwork,
+): Promise<number> {
+  const generation = cacheGeneration;
   const apiUrl = getApiUrl(network);
   const response = await fetch(`${apiUrl}/extended/v2/blocks/${height}`);
 
@@ -52,31 +102,43 @@ export async function fetchBlockTime(
   const data = await response.json();
   const blockTime: number = data.block_time ?? data.burn_block_time ?? 0;
 
-  evictIfNeeded();
-  blockTimeCache.set(height, blockTime);
+  if (generation === cacheGeneration) {
+    setCached(height, blockTime);
+  }
 
   return blockTime;
 }
 
 /**
- * Fetch block times for multiple heights in parallel.
+ * Fetch block times for multiple heights in parallel, with at most
+ * MAX_CONCURRENT_FETCHES requests in flight at once.
+ * Failed heights are left out of the result.
  * Returns a map of height -> Unix timestamp.
  */
 export async function fetchBlockTimes(
   heights: number[],
   network?: SupportedNetwork,
 ): Promise<Map<number, number>> {
-  const uncached = heights.filter((h) => !blockTimeCache.has(h));
+  const uncached = [...new Set(heights)].filter((h) => !blockTimeCache.has(h));
+
+  let next = 0;
+  const worker = async (): Promise<void> => {
+    while (next < uncached.length) {
+      const height = uncached[next++]!;
+      try {
+        await fetchBlockTime(height, network);
+      } catch {
+        // Missing heights are simply absent from the result
+      }
+    }
+  };
 
-  if (uncached.length > 0) {
-    await Promise.allSettled(
-      uncached.map((h) => fetchBlockTime(h, network)),
-    );
-  }
+  const workerCount = Math.min(MAX_CONCURRENT_FETCHES, uncached.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
 
   const result = new Map<number, number>();
   for (const height of heights) {
-    const time = blockTimeCache.get(height);
+    const time = getCached(height);
     if (time !== undefined) result.set(height, time);
   }
 
@@ -101,14 +163,16 @@ export async function blockHeightToDate(
  */
 export function seedBlockTimeCache(entries: Array<[number, number]>): void {
   for (const [height, time] of entries) {
-    evictIfNeeded();
-    blockTimeCache.set(height, time);
+    setCached(height, time);
   }
 }
 
 /**
- * Clear the block time cache.
+ * Clear the block time cache. Requests still in flight resolve for their
+ * own callers but are no longer shared or cached.
  */
 export function clearBlockTimeCache(): void {
   blockTimeCache.clear();
+  pendingBlockTimes.clear();
+  cacheGeneration++;
 }
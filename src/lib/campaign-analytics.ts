@@ -75,6 +75,8 @@ export function estimateRemainingBlocks(
   return Number((remaining * 10000n) / scaledRate);
 }
 
+const SECONDS_PER_DAY = 86_400;
+
 /**
  * Bucket impression data into daily totals for charting.
  * Takes an array of {timestamp, count} entries and groups by UTC date.
@@ -84,21 +86,27 @@ export function estimateRemainingBlocks(
 export function bucketByDay(
   entries: ReadonlyArray<{ timestamp: number; count: number }>,
 ): Array<{ date: string; total: number }> {
-  const buckets = new Map<string, number>();
+  // Key by integer UTC day number; only format a date string once per
+  // bucket rather than once per entry.
+  const buckets = new Map<number, number>();
 
   for (const entry of entries) {
-    const d = new Date(entry.timestamp * 1000);
-    const key = d.toISOString().slice(0, 10);
-    buckets.set(key, (buckets.get(key) ?? 0) + entry.count);
+    const day = Math.floor(entry.timestamp / SECONDS_PER_DAY);
+    buckets.set(day, (buckets.get(day) ?? 0) + entry.count);
   }
 
-  return Array.from(buckets.entries())
-    .map(([date, total]) => ({ date, total }))
-    .sort((a, b) => a.date.localeCompare(b.date));
+  return Array.from(buckets.keys())
+    .sort((a, b) => a - b)
+    .map((day) => ({
+      date: new Date(day * SECONDS_PER_DAY * 1000).toISOString().slice(0, 10),
+      total: buckets.get(day)!,
+    }));
 }
 
 /**
  * Compute a moving average over daily totals.
+ * Keeps a running window sum, so each point costs O(1) regardless of
+ * the window size.
  *
  * @param data — output from bucketByDay
  * @param window — number of days to average (default 7)
@@ -107,10 +115,14 @@ export function movingAverage(
   data: ReadonlyArray<{ date: string; total: number }>,
   window = 7,
 ): Array<{ date: string; average: number }> {
-  return data.map((point, i) => {
-    const start = Math.max(0, i - window + 1);
-    const slice = data.slice(start, i + 1);
-    const sum = slice.reduce((acc, d) => acc + d.total, 0);
-    return { date: point.date, average: sum / slice.length };
-  });
+  const result: Array<{ date: string; average: number }> = new Array(data.length);
+  let sum = 0;
+
+  for (let i = 0; i < data.length; i++) {
+    sum += data[i]!.total;
+    if (i >= window) sum -= data[i - window]!.total;
+    result[i] = { date: data[i]!.date, average: sum / Math.min(i + 1, window) };
+  }
+
+  return result;
 }
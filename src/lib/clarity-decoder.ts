@@ -15,6 +15,8 @@
  *   0x0b = some,  0x0f = list,  0x02 = buffer
  */
 
+import { bytesToHex, hexToBytes, utf8Decode } from '@/utils/hex-utils';
+
 export type DecodedClarityValue =
   | { type: 'uint'; value: bigint }
   | { type: 'int'; value: bigint }
@@ -33,7 +35,10 @@ export type DecodedClarityValue =
 /** Internal reader that tracks position through the hex buffer. */
 class HexReader {
   private pos = 0;
-  constructor(private readonly bytes: Uint8Array) {}
+  private readonly view: DataView;
+  constructor(private readonly bytes: Uint8Array) {
+    this.view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  }
 
   get remaining(): number {
     return this.bytes.length - this.pos;
@@ -46,73 +51,62 @@ class HexReader {
     return this.bytes[this.pos++]!;
   }
 
+  /** Read `n` bytes into a new array the caller may keep. */
   readBytes(n: number): Uint8Array {
+    const start = this.advance(n);
+    return this.bytes.slice(start, start + n);
+  }
+
+  /**
+   * Read `n` bytes as a view over the underlying buffer (no copy).
+   * Only for bytes that are consumed immediately and not returned.
+   */
+  viewBytes(n: number): Uint8Array {
+    const start = this.advance(n);
+    return this.bytes.subarray(start, start + n);
+  }
+
+  /** Reserve `n` bytes and return the offset they start at. */
+  private advance(n: number): number {
     if (this.pos + n > this.bytes.length) {
       throw new Error(`Cannot read ${n} bytes, only ${this.remaining} remaining`);
     }
-    const slice = this.bytes.slice(this.pos, this.pos + n);
+    const start = this.pos;
     this.pos += n;
-    return slice;
+    return start;
   }
 
   readUint32(): number {
-    const bytes = this.readBytes(4);
-    return (bytes[0]! << 24) | (bytes[1]! << 16) | (bytes[2]! << 8) | bytes[3]!;
+    return this.view.getUint32(this.advance(4));
   }
 
   /** Read a 16-byte big-endian unsigned int (uint128). */
   readUint128(): bigint {
-    const bytes = this.readBytes(16);
-    let result = 0n;
-    for (let i = 0; i < 16; i++) {
-      result = (result << 8n) | BigInt(bytes[i]!);
-    }
-    return result;
+    const start = this.advance(16);
+    return (this.view.getBigUint64(start) << 64n) | this.view.getBigUint64(start + 8);
   }
 
   /** Read a 16-byte big-endian signed int (int128). */
   readInt128(): bigint {
-    const bytes = this.readBytes(16);
-    let result = 0n;
-    for (let i = 0; i < 16; i++) {
-      result = (result << 8n) | BigInt(bytes[i]!);
-    }
-    // Handle sign bit for 128-bit integers
-    const signBit = 1n << 127n;
-    if (result >= signBit) {
-      result -= 1n << 128n;
-    }
-    return result;
+    // The high word carries the sign, so reading it signed yields the
+    // two's-complement value without a separate adjustment step
+    const start = this.advance(16);
+    return (this.view.getBigInt64(start) << 64n) | this.view.getBigUint64(start + 8);
   }
 
   /** Read a length-prefixed ASCII string (4-byte length + chars). */
   readLenPrefixedAscii(): string {
     const len = this.readUint32();
-    const bytes = this.readBytes(len);
+    const bytes = this.viewBytes(len);
     return String.fromCharCode(...bytes);
   }
 
   /** Read a length-prefixed UTF-8 string (4-byte length + bytes). */
   readLenPrefixedUtf8(): string {
     const len = this.readUint32();
-    const bytes = this.readBytes(len);
-    return new TextDecoder().decode(bytes);
-  }
-}
-
-/**
- * Convert a hex string (with or without 0x prefix) to a Uint8Array.
- */
-function hexToBytes(hex: string): Uint8Array {
-  const clean = hex.startsWith('0x') ? hex.slice(2) : hex;
-  if (clean.length % 2 !== 0) {
-    throw new Error('Hex string must have even length');
+    const bytes = this.viewBytes(len);
+    return utf8Decode(bytes);
   }
-  const bytes = new Uint8Array(clean.length / 2);
-  for (let i = 0; i < clean.length; i += 2) {
-    bytes[i / 2] = parseInt(clean.substring(i, i + 2), 16);
-  }
-  return bytes;
 }
 
 /**
@@ -120,15 +114,12 @@ function hexToBytes(hex: string): Uint8Array {
  */
 function readStandardPrincipal(reader: HexReader): string {
   const version = reader.readByte();
-  const hash = reader.readBytes(20);
+  const hash = reader.viewBytes(20);
 
   // Encode as a c32check address (simplified - returns hex representation)
   // In production, use @stacks/transactions c32addressDecode
   const prefix = version === 22 ? 'SP' : version === 26 ? 'ST' : `S${version}`;
-  const hashHex = Array.from(hash)
-    .map((b) => b.toString(16).padStart(2, '0'))
-    .join('');
-  return `${prefix}${hashHex}`;
+  return `${prefix}${bytesToHex(hash)}`;
 }
 
 /**
@@ -181,9 +172,14 @@ function decodeValue(reader: HexReader): DecodedClarityValue {
 
     case 0x0b: { // list
       const count = reader.readUint32();
-      const items: DecodedClarityValue[] = [];
+      // Every element takes at least one byte, so a larger count is
+      // malformed; checking first keeps the preallocation bounded
+      if (count > reader.remaining) {
+        throw new Error(`List length ${count} exceeds remaining ${reader.remaining} bytes`);
+      }
+      const items: DecodedClarityValue[] = new Array(count);
       for (let i = 0; i < count; i++) {
-        items.push(decodeValue(reader));
+        items[i] = decodeValue(reader);
       }
       return { type: 'list', value: items };
     }
@@ -193,7 +189,7 @@ function decodeValue(reader: HexReader): DecodedClarityValue {
       const fields: Record<string, DecodedClarityValue> = {};
       for (let i = 0; i < fieldCount; i++) {
         const nameLen = reader.readByte();
-        const nameBytes = reader.readBytes(nameLen);
+        const nameBytes = reader.viewBytes(nameLen);
         const name = String.fromCharCode(...nameBytes);
         fields[name] = decodeValue(reader);
       }
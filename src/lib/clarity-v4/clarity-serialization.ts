@@ -1,19 +1,9 @@
 // Clarity v4 Serialization Helpers
+import { bytesToHex, hexToBytes, utf8Encode } from '@/utils/hex-utils';
 
-export type SerializedClarity = { hex: string; type: string };
-
-export function bytesToHex(bytes: Uint8Array): string {
-  return Array.from(bytes).map(b => b.toString(16).padStart(2, '0')).join('');
-}
+export { bytesToHex, hexToBytes } from '@/utils/hex-utils';
 
-export function hexToBytes(hex: string): Uint8Array {
-  const clean = hex.startsWith('0x') ? hex.slice(2) : hex;
-  const result = new Uint8Array(clean.length / 2);
-  for (let i = 0; i < result.length; i++) {
-    result[i] = parseInt(clean.slice(i * 2, i * 2 + 2), 16);
-  }
-  return result;
-}
+export type SerializedClarity = { hex: string; type: string };
 
 export function serializeUint(value: bigint): string {
   const buf = new ArrayBuffer(16);
@@ -60,7 +50,7 @@ export function encodeLength(n: number): string {
 }
 
 export function encodeString(s: string): string {
-  const bytes = new TextEncoder().encode(s);
+  const bytes = utf8Encode(s);
   return encodeLength(bytes.length) + bytesToHex(bytes);
 }
 
@@ -1,4 +1,5 @@
 // Clarity v4 String Type Utilities
+import { utf8Encode } from '@/utils/hex-utils';
 
 export type StringAscii = { type: 'string-ascii'; value: string; maxLength: number };
 
@@ -26,7 +27,7 @@ export function makeStringAscii(value: string, maxLength = DEFAULT_MAX_STRING_LE
 }
 
 export function makeStringUtf8(value: string, maxLength = DEFAULT_MAX_STRING_LENGTH): StringUtf8 {
-  const byteLen = new TextEncoder().encode(value).length;
+  const byteLen = utf8Encode(value).length;
   if (byteLen > maxLength) throw new RangeError(`UTF-8 string too long: ${byteLen} bytes`);
   return { type: 'string-utf8', value, maxLength };
 }
@@ -36,7 +37,7 @@ export function asciiLength(s: StringAscii): number {
 }
 
 export function utf8ByteLength(s: StringUtf8): number {
-  return new TextEncoder().encode(s.value).length;
+  return utf8Encode(s.value).length;
 }
 
 export function concatAscii(a: StringAscii, b: StringAscii): StringAscii {
@@ -3,6 +3,19 @@
  * Formatting helpers for UI display
  */
 
+// Intl formatters are expensive to construct, so the fixed-option ones
+// used by the helpers below are built once and reused.
+const DEFAULT_TIMESTAMP_OPTIONS: Intl.DateTimeFormatOptions = {
+  year: 'numeric',
+  month: 'short',
+  day: 'numeric',
+  hour: '2-digit',
+  minute: '2-digit',
+};
+const TIMESTAMP_FORMAT = new Intl.DateTimeFormat('en-US', DEFAULT_TIMESTAMP_OPTIONS);
+const RELATIVE_TIME_FORMAT = new Intl.RelativeTimeFormat('en', { numeric: 'auto' });
+const NUMBER_FORMAT = new Intl.NumberFormat('en-US');
+
 /**
  * Truncate Stacks address for display
  * @example SP2...XYZ9
@@ -78,16 +91,9 @@ export function formatTimestamp(
 ): string {
   const date = new Date(timestamp * 1000); // Convert seconds to milliseconds
 
-  const defaultOptions: Intl.DateTimeFormatOptions = {
-    year: 'numeric',
-    month: 'short',
-    day: 'numeric',
-    hour: '2-digit',
-    minute: '2-digit',
-    ...options,
-  };
+  if (!options) return TIMESTAMP_FORMAT.format(date);
 
-  return new Intl.DateTimeFormat('en-US', defaultOptions).format(date);
+  return new Intl.DateTimeFormat('en-US', { ...DEFAULT_TIMESTAMP_OPTIONS, ...options }).format(date);
 }
 
 /**
@@ -100,7 +106,7 @@ export function formatRelativeTime(timestamp: number): string {
   const diffMs = date.getTime() - now;
   const diffSec = Math.floor(Math.abs(diffMs) / 1000);
 
-  const rtf = new Intl.RelativeTimeFormat('en', { numeric: 'auto' });
+  const rtf = RELATIVE_TIME_FORMAT;
 
   if (diffSec < 60) {
     return rtf.format(diffMs < 0 ? -diffSec : diffSec, 'second');
@@ -207,34 +213,38 @@ export function formatFee(feeRate: string): string {
   return `${cleaned} STX`;
 }
 
+/** Display labels for campaign statuses, keyed by lowercase status. */
+const CAMPAIGN_STATUS_LABELS: Readonly<Record<string, string>> = {
+  draft: 'Draft',
+  active: 'Active',
+  paused: 'Paused',
+  completed: 'Completed',
+  cancelled: 'Cancelled',
+};
+
+const DEFAULT_STATUS_COLOR = 'bg-gray-100 text-gray-800 dark:bg-gray-800 dark:text-gray-300';
+
+/** Tailwind classes for campaign statuses, keyed by lowercase status. */
+const CAMPAIGN_STATUS_COLORS: Readonly<Record<string, string>> = {
+  draft: DEFAULT_STATUS_COLOR,
+  active: 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400',
+  paused: 'bg-yellow-100 text-yellow-800 dark:bg-yellow-900/30 dark:text-yellow-400',
+  completed: 'bg-blue-100 text-blue-800 dark:bg-blue-900/30 dark:text-blue-400',
+  cancelled: 'bg-red-100 text-red-800 dark:bg-red-900/30 dark:text-red-400',
+};
+
 /**
  * Format campaign status for display
  */
 export function formatCampaignStatus(status: string): string {
-  const statusMap: Record<string, string> = {
-    draft: 'Draft',
-    active: 'Active',
-    paused: 'Paused',
-    completed: 'Completed',
-    cancelled: 'Cancelled',
-  };
-
-  return statusMap[status.toLowerCase()] || status;
+  return CAMPAIGN_STATUS_LABELS[status.toLowerCase()] || status;
 }
 
 /**
  * Get status color class for Tailwind (with dark mode)
  */
 export function getStatusColorClass(status: string): string {
-  const colorMap: Record<string, string> = {
-    draft: 'bg-gray-100 text-gray-800 dark:bg-gray-800 dark:text-gray-300',
-    active: 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400',
-    paused: 'bg-yellow-100 text-yellow-800 dark:bg-yellow-900/30 dark:text-yellow-400',
-    completed: 'bg-blue-100 text-blue-800 dark:bg-blue-900/30 dark:text-blue-400',
-    cancelled: 'bg-red-100 text-red-800 dark:bg-red-900/30 dark:text-red-400',
-  };
-
-  return colorMap[status.toLowerCase()] || 'bg-gray-100 text-gray-800 dark:bg-gray-800 dark:text-gray-300';
+  return CAMPAIGN_STATUS_COLORS[status.toLowerCase()] || DEFAULT_STATUS_COLOR;
 }
 
 /**
@@ -242,7 +252,7 @@ export function getStatusColorClass(status: string): string {
  * @example 1234567 -> "1,234,567"
  */
 export function formatNumber(value: number | bigint): string {
-  return Number(value).toLocaleString('en-US');
+  return NUMBER_FORMAT.format(Number(value));
 }
 
 /**
@@ -7,6 +7,7 @@
 
 import { openSignMessage, openStructuredDataSignature } from '@stacks/connect';
 import { APP_DETAILS } from './stacks-config';
+import { bytesToHex } from '@/utils/hex-utils';
 
 // ---------------------------------------------------------------------------
 // Types
@@ -91,9 +92,7 @@ export function generateSigningNonce(): string {
   if (typeof crypto !== 'undefined') {
     crypto.getRandomValues(bytes);
   }
-  return Array.from(bytes)
-    .map((b) => b.toString(16).padStart(2, '0'))
-    .join('');
+  return bytesToHex(bytes);
 }
 
 /**
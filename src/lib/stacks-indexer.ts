@@ -46,26 +46,38 @@ let globalIndex: EventIndex = {
 // ---------------------------------------------------------------------------
 
 /**
- * Add a decoded event to the index.
+ * Add a batch of decoded events to the index.
+ * Events are appended in one pass; callers sort `allEvents` once after
+ * all batches are in rather than shifting the array per event.
  */
-function indexEvent(event: DecodedEvent): void {
-  globalIndex.allEvents.unshift(event);
-
-  // Index by campaign ID
-  const campaignId = Number((event.event as any)['campaign-id'] ?? -1);
-  if (campaignId >= 0) {
-    const existing = globalIndex.byCampaign.get(campaignId) ?? [];
-    existing.push(event);
-    globalIndex.byCampaign.set(campaignId, existing);
+function indexEvents(events: DecodedEvent[]): void {
+  const { allEvents, byCampaign, byType } = globalIndex;
+
+  for (const event of events) {
+    allEvents.push(event);
+
+    // Index by campaign ID
+    const campaignId = Number((event.event as any)['campaign-id'] ?? -1);
+    if (campaignId >= 0) {
+      const campaignEvents = byCampaign.get(campaignId);
+      if (campaignEvents) {
+        campaignEvents.push(event);
+      } else {
+        byCampaign.set(campaignId, [event]);
+      }
+    }
+
+    // Index by event type
+    const eventType = event.event.event;
+    const typeEvents = byType.get(eventType);
+    if (typeEvents) {
+      typeEvents.push(event);
+    } else {
+      byType.set(eventType, [event]);
+    }
   }
 
-  // Index by event type
-  const eventType = event.event.event;
-  const typeEvents = globalIndex.byType.get(eventType) ?? [];
-  typeEvents.push(event);
-  globalIndex.byType.set(eventType, typeEvents);
-
-  globalIndex.totalCount++;
+  globalIndex.totalCount += events.length;
 }
 
 /**
@@ -80,9 +92,7 @@ async function syncContract(
   const data = await fetchContractEvents(contractId, { limit, network });
 
   const decoded = decodeAdStackEvents(data.results ?? []);
-  for (const event of decoded) {
-    indexEvent(event);
-  }
+  indexEvents(decoded);
 
   return decoded.length;
 }
@@ -1,17 +1,118 @@
 // Stacks.js ClarityValue comparison utilities
 import type { ClarityValue } from './clarity-value-factory';
 
-export function cvEqual(a: ClarityValue, b: ClarityValue): boolean {
-  if (a.type !== b.type) return false;
-  return JSON.stringify(a) === JSON.stringify(b);
+function bytesEqual(a: Uint8Array, b: Uint8Array): boolean {
+  if (a.length !== b.length) return false;
+  for (let i = 0; i < a.length; i++) {
+    if (a[i] !== b[i]) return false;
+  }
+  return true;
+}
+
+function order<T extends bigint | number | string>(a: T, b: T): -1 | 0 | 1 {
+  return a < b ? -1 : a > b ? 1 : 0;
 }
 
+// Structural comparison walks the value tree directly instead of
+// serializing both sides to JSON (which also throws on bigint fields).
+export function cvEqual(a: ClarityValue, b: ClarityValue): boolean {
+  if (a === b) return true;
+  if (a.type !== b.type) return false;
+  switch (a.type) {
+    case 'uint':
+    case 'int':
+    case 'bool':
+      return a.value === (b as typeof a).value;
+    case 'none':
+      return true;
+    case 'some':
+    case 'ok':
+    case 'error':
+      return cvEqual(a.value, (b as typeof a).value);
+    case 'buffer':
+      return bytesEqual(a.buffer, (b as typeof a).buffer);
+    case 'string-ascii':
+    case 'string-utf8':
+      return a.data === (b as typeof a).data;
+    case 'standard_principal':
+    case 'contract_principal':
+      return cvPrincipalEqual(a, b);
+    case 'list': {
+      const other = (b as typeof a).list;
+      if (a.list.length !== other.length) return false;
+      for (let i = 0; i < a.list.length; i++) {
+        if (!cvEqual(a.list[i]!, other[i]!)) return false;
+      }
+      return true;
+    }
+    case 'tuple': {
+      const otherData = (b as typeof a).data;
+      const keys = Object.keys(a.data);
+      if (keys.length !== Object.keys(otherData).length) return false;
+      for (const key of keys) {
+        const other = otherData[key];
+        if (!other || !cvEqual(a.data[key]!, other)) return false;
+      }
+      return true;
+    }
+  }
+}
+
+// Orders by type tag first, then by the natural order of the payload.
 export function cvCompare(a: ClarityValue, b: ClarityValue): -1 | 0 | 1 {
-  const aStr = JSON.stringify(a);
-  const bStr = JSON.stringify(b);
-  if (aStr < bStr) return -1;
-  if (aStr > bStr) return 1;
-  return 0;
+  if (a.type !== b.type) return order(a.type, b.type);
+  switch (a.type) {
+    case 'uint':
+    case 'int':
+      return order(a.value, (b as typeof a).value);
+    case 'bool':
+      return order(Number(a.value), Number((b as typeof a).value));
+    case 'none':
+      return 0;
+    case 'some':
+    case 'ok':
+    case 'error':
+      return cvCompare(a.value, (b as typeof a).value);
+    case 'buffer': {
+      const other = (b as typeof a).buffer;
+      const len = Math.min(a.buffer.length, other.length);
+      for (let i = 0; i < len; i++) {
+        if (a.buffer[i] !== other[i]) return order(a.buffer[i]!, other[i]!);
+      }
+      return order(a.buffer.length, other.length);
+    }
+    case 'string-ascii':
+    case 'string-utf8':
+      return order(a.data, (b as typeof a).data);
+    case 'standard_principal':
+      return order(a.address, (b as typeof a).address);
+    case 'contract_principal': {
+      const other = b as typeof a;
+      return order(a.address, other.address) || order(a.contractName, other.contractName);
+    }
+    case 'list': {
+      const other = (b as typeof a).list;
+      const len = Math.min(a.list.length, other.length);
+      for (let i = 0; i < len; i++) {
+        const cmp = cvCompare(a.list[i]!, other[i]!);
+        if (cmp !== 0) return cmp;
+      }
+      return order(a.list.length, other.length);
+    }
+    case 'tuple': {
+      const other = (b as typeof a).data;
+      const aKeys = Object.keys(a.data).sort();
+      const bKeys = Object.keys(other).sort();
+      const len = Math.min(aKeys.length, bKeys.length);
+      for (let i = 0; i < len; i++) {
+        const keyCmp = order(aKeys[i]!, bKeys[i]!);
+        if (keyCmp !== 0) return keyCmp;
+        const cmp = cvCompare(a.data[aKeys[i]!]!, other[bKeys[i]!]!);
+        if (cmp !== 0) return cmp;
+      }
+      return order(aKeys.length, bKeys.length);
+    }
+  }
 }
 
 export function cvUintEqual(a: ClarityValue, b: ClarityValue): boolean {
@@ -43,8 +144,9 @@ export function cvBoolEqual(a: ClarityValue, b: ClarityValue): boolean {
 export function cvPrincipalEqual(a: ClarityValue, b: ClarityValue): boolean {
   const aIsP = a.type === 'standard_principal' || a.type === 'contract_principal';
   const bIsP = b.type === 'standard_principal' || b.type === 'contract_principal';
-  if (!aIsP || !bIsP) return false;
-  return JSON.stringify(a) === JSON.stringify(b);
+  if (!aIsP || !bIsP || a.type !== b.type) return false;
+  if (a.address !== b.address) return false;
+  return a.type === 'standard_principal' || a.contractName === (b as typeof a).contractName;
 }
 
 // Comparator utility 1 - check for specific uint values
@@ -1,4 +1,5 @@
 // Stacks.js ClarityValue human-readable printer
+import { bytesToHex } from '@/utils/hex-utils';
 import type { ClarityValue } from './clarity-value-factory';
 
 export function cvToString(cv: ClarityValue): string {
@@ -8,7 +9,7 @@ export function cvToString(cv: ClarityValue): string {
     case 'bool': return `${(cv as { type: 'bool'; value: boolean }).value}`;
     case 'none': return 'none';
     case 'some': return `(some ${cvToString((cv as { type: 'some'; value: ClarityValue }).value)})`;
-    case 'buffer': return `0x${Array.from((cv as { type: 'buffer'; buffer: Uint8Array }).buffer).map(b => b.toString(16).padStart(2, '0')).join('')}`;
+    case 'buffer': return `0x${bytesToHex((cv as { type: 'buffer'; buffer: Uint8Array }).buffer)}`;
     case 'string-ascii': return `"${(cv as { type: 'string-ascii'; data: string }).data}"`;
     case 'string-utf8': return `u"${(cv as { type: 'string-utf8'; data: string }).data}"`;
     case 'standard_principal': return `'${(cv as { type: 'standard_principal'; address: string }).address}`;
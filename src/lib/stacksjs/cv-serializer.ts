@@ -1,19 +1,16 @@
 // Stacks.js ClarityValue serialization to hex
+import { bytesToHex, utf8Encode } from '@/utils/hex-utils';
 import type { ClarityValue, UintCV, IntCV, BoolCV, NoneCV, BufferCV, StringAsciiCV, StringUtf8CV } from './clarity-value-factory';
 
 export type SerializedCV = { hex: string; type: string };
 
-function bytesToHex(bytes: Uint8Array): string {
-  return Array.from(bytes).map(b => b.toString(16).padStart(2, '0')).join('');
-}
-
+// Fixed width: two big-endian 64-bit writes instead of a 16-step BigInt loop.
+// setBigUint64 wraps modulo 2^64, which matches the old byte truncation.
 function bigIntToBytes16(n: bigint): Uint8Array {
   const bytes = new Uint8Array(16);
-  let val = n;
-  for (let i = 15; i >= 0; i--) {
-    bytes[i] = Number(val & BigInt(0xff));
-    val >>= BigInt(8);
-  }
+  const view = new DataView(bytes.buffer);
+  view.setBigUint64(0, n >> 64n);
+  view.setBigUint64(8, n);
   return bytes;
 }
 
@@ -22,10 +19,9 @@ export function serializeUintCV(cv: UintCV): string {
 }
 
 export function serializeIntCV(cv: IntCV): string {
-  const twosComplement = cv.value < BigInt(0)
-    ? BigInt('340282366920938463463374607431768211456') + cv.value
-    : cv.value;
-  return '00' + bytesToHex(bigIntToBytes16(twosComplement));
+  // bigIntToBytes16 wraps each 64-bit half, which already yields the
+  // 128-bit two's-complement bytes for negative values
+  return '00' + bytesToHex(bigIntToBytes16(cv.value));
 }
 
 export function serializeBoolCV(cv: BoolCV): string {
@@ -42,13 +38,13 @@ export function serializeBufferCV(cv: BufferCV): string {
 }
 
 export function serializeStringAsciiCV(cv: StringAsciiCV): string {
-  const bytes = new TextEncoder().encode(cv.data);
+  const bytes = utf8Encode(cv.data);
   const lengthHex = bytes.length.toString(16).padStart(8, '0');
   return '0d' + lengthHex + bytesToHex(bytes);
 }
 
 export function serializeStringUtf8CV(cv: { type: 'string-utf8'; data: string }): string {
-  const bytes = new TextEncoder().encode(cv.data);
+  const bytes = utf8Encode(cv.data);
   const lengthHex = bytes.length.toString(16).padStart(8, '0');
   return '0e' + lengthHex + bytesToHex(bytes);
 }
@@ -80,9 +76,9 @@ export function serializeTupleCV(data: Record<string, ClarityValue>): string {
   const entries = Object.entries(data);
   const countHex = entries.length.toString(16).padStart(8, '0');
   const serialized = entries.map(([k, v]) => {
-    const keyBytes = new TextEncoder().encode(k);
+    const keyBytes = utf8Encode(k);
     return keyBytes.length.toString(16).padStart(2, '0') +
-      Array.from(keyBytes).map(b => b.toString(16).padStart(2, '0')).join('') +
+      bytesToHex(keyBytes) +
       serializeClarityValue(v);
   }).join('');
   return '0c' + countHex + serialized;
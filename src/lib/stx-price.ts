@@ -30,25 +30,56 @@ export interface PriceConversion {
 export const MICRO_STX_DECIMALS = 6;
 export const MICRO_STX_PER_STX = 1_000_000;
 
+// Formatters are built once; toLocaleString with options constructs a
+// new Intl.NumberFormat on every call.
+const STX_FORMAT = new Intl.NumberFormat('en-US', { maximumFractionDigits: 6 });
+const USD_FORMAT = new Intl.NumberFormat('en-US', {
+  style: 'currency',
+  currency: 'USD',
+  maximumFractionDigits: 2,
+});
+
 // Simple in-memory cache with TTL
 let priceCache: { price: STXPrice; fetchedAt: number } | null = null;
 const CACHE_TTL_MS = 60_000; // 1 minute
 
+// Request currently in flight, shared by concurrent callers
+let pendingPrice: Promise<STXPrice> | null = null;
+
+// Bumped on invalidation so a fetch started before it cannot refill the cache
+let cacheGeneration = 0;
+
 // ---------------------------------------------------------------------------
 // Price Fetching
 // ---------------------------------------------------------------------------
 
 /**
  * Fetch the current STX/USD price from CoinGecko.
- * Falls back to a cached value if the request fails.
+ * Falls back to a cached value if the request fails. Callers that arrive
+ * while a fetch is already running share its result instead of opening
+ * another connection.
  */
 export async function fetchSTXPrice(): Promise<STXPrice> {
-  const now = Date.now();
-
-  if (priceCache && now - priceCache.fetchedAt < CACHE_TTL_MS) {
+  if (priceCache && Date.now() - priceCache.fetchedAt < CACHE_TTL_MS) {
     return priceCache.price;
   }
 
+  if (!pendingPrice) {
+    const request: Promise<STXPrice> = requestSTXPrice().finally(() => {
+      if (pendingPrice === request) pendingPrice = null;
+    });
+    pendingPrice = request;
+  }
+  return pendingPrice;
+}
+
+/**
+ * Perform the CoinGecko request and refresh the cache.
+ */
+async function requestSTXPrice(): Promise<STXPrice> {
+  const now = Date.now();
+  const generation = cacheGeneration;
+
   try {
     const response = await fetch(
       'https://api.coingecko.com/api/v3/simple/price?ids=blockstack&vs_currencies=usd&include_24hr_change=true&include_market_cap=true&include_last_updated_at=true',
@@ -69,7 +100,9 @@ export async function fetchSTXPrice(): Promise<STXPrice> {
       last_updated_at: stxData.last_updated_at ?? Math.floor(now / 1000),
     };
 
-    priceCache = { price, fetchedAt: now };
+    if (generation === cacheGeneration) {
+      priceCache = { price, fetchedAt: now };
+    }
     return price;
   } catch {
     // Return cached price or default on failure
@@ -110,12 +143,8 @@ export function formatMicroStx(
     microStx: BigInt(microStx),
     stx,
     usd,
-    formattedStx: stx.toLocaleString('en-US', { maximumFractionDigits: 6 }),
-    formattedUsd: usd.toLocaleString('en-US', {
-      style: 'currency',
-      currency: 'USD',
-      maximumFractionDigits: 2,
-    }),
+    formattedStx: STX_FORMAT.format(stx),
+    formattedUsd: USD_FORMAT.format(usd),
   };
 }
 
@@ -129,8 +158,12 @@ export function usdToMicroStx(usd: number, stxPriceUsd: number): bigint {
 }
 
 /**
- * Invalidate the price cache (forces re-fetch on next call).
+ * Invalidate the price cache (forces re-fetch on next call). A fetch
+ * already in flight still resolves for its callers but is not shared or
+ * cached.
  */
 export function invalidatePriceCache(): void {
   priceCache = null;
+  pendingPrice = null;
+  cacheGeneration++;
 }
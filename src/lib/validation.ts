@@ -17,6 +17,9 @@
 
 export type Validator<T = string> = (value: T) => string | undefined;
 
+/** SP/ST prefix followed by 39+ alphanumeric characters. */
+const STACKS_ADDRESS_PATTERN = /^(SP|ST)[A-Z0-9]{39,}$/i;
+
 /** Compose multiple validators — returns the first error encountered. */
 export function compose<T>(...validators: Validator<T>[]): Validator<T> {
   return (value: T) => {
@@ -84,7 +87,7 @@ export function integer(message = 'Must be a whole number'): Validator<number> {
 export function stacksAddress(message = 'Invalid Stacks address'): Validator<string> {
   return (value) => {
     if (!value) return undefined; // Let `required` handle empty
-    const isValid = /^(SP|ST)[A-Z0-9]{39,}$/i.test(value);
+    const isValid = STACKS_ADDRESS_PATTERN.test(value);
     return isValid ? undefined : message;
   };
 }
@@ -6,6 +6,7 @@
 import { userSession } from './wallet';
 import { SESSION_KEYS } from './appkit-config';
 import { CURRENT_NETWORK } from './stacks-config';
+import { bytesToHex, hexToBytes, utf8Encode } from '@/utils/hex-utils';
 
 /** Maximum session age before automatic expiry (30 days in ms). */
 const SESSION_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
@@ -13,6 +14,12 @@ const SESSION_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
 /** Interval between background session expiry checks (5 minutes in ms). */
 const SESSION_CHECK_INTERVAL_MS = 5 * 60 * 1000;
 
+/**
+ * Exact form of a session digest as produced by createSessionSignature:
+ * 32 bytes of lowercase hex with no 0x prefix. Anything else is rejected.
+ */
+const SESSION_DIGEST_PATTERN = /^[0-9a-f]{64}$/;
+
 /**
  * Session Data Interface
  */
@@ -187,23 +194,26 @@ function getOrCreateSessionSecret(): string {
   if (!secret) {
     const bytes = new Uint8Array(32);
     crypto.getRandomValues(bytes);
-    secret = Array.from(bytes, (b) => b.toString(16).padStart(2, '0')).join('');
+    secret = bytesToHex(bytes);
     localStorage.setItem(KEY, secret);
   }
   return secret;
 }
 
-async function hmacSha256(secret: string, data: string): Promise<string> {
-  const encoder = new TextEncoder();
-  const key = await crypto.subtle.importKey(
+function importHmacKey(secret: string): Promise<CryptoKey> {
+  return crypto.subtle.importKey(
     'raw',
-    encoder.encode(secret),
+    utf8Encode(secret),
     { name: 'HMAC', hash: 'SHA-256' },
     false,
-    ['sign'],
+    ['sign', 'verify'],
   );
-  const signature = await crypto.subtle.sign('HMAC', key, encoder.encode(data));
-  return Array.from(new Uint8Array(signature), (b) => b.toString(16).padStart(2, '0')).join('');
+}
+
+async function hmacSha256(secret: string, data: string): Promise<string> {
+  const key = await importHmacKey(secret);
+  const signature = await crypto.subtle.sign('HMAC', key, utf8Encode(data));
+  return bytesToHex(new Uint8Array(signature));
 }
 
 /**
@@ -252,16 +262,19 @@ export async function verifySessionSignature(
     const MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
     if (Date.now() - timestamp > MAX_AGE_MS) return false;
 
-    const payload = `AdStack Session ${timestamp}`;
-    const expectedDigest = await hmacSha256(secret, `${address}:${payload}`);
+    if (!SESSION_DIGEST_PATTERN.test(providedDigest)) return false;
+    const digest = hexToBytes(providedDigest);
 
-    // Constant-length comparison to avoid timing leaks
-    if (providedDigest.length !== expectedDigest.length) return false;
-    let mismatch = 0;
-    for (let i = 0; i < providedDigest.length; i++) {
-      mismatch |= providedDigest.charCodeAt(i) ^ expectedDigest.charCodeAt(i);
-    }
-    return mismatch === 0;
+    // subtle.verify compares the raw MAC in constant time, so the
+    // expected digest never needs to be hex-encoded for comparison
+    const payload = `AdStack Session ${timestamp}`;
+    const key = await importHmacKey(secret);
+    return await crypto.subtle.verify(
+      'HMAC',
+      key,
+      digest,
+      utf8Encode(`${address}:${payload}`),
+    );
   } catch (error) {
     console.error('Failed to verify session signature:', error);
     return false;
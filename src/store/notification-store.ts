@@ -38,6 +38,23 @@ function saveToStorage(notifications: Notification[]) {
   }
 }
 
+let persistScheduled = false;
+
+/**
+ * Persist the current notifications once the running task yields.
+ * Bursts of updates (e.g. several confirmations landing together) are
+ * coalesced into a single JSON.stringify + localStorage write instead of
+ * one synchronous write per update.
+ */
+function schedulePersist() {
+  if (persistScheduled) return;
+  persistScheduled = true;
+  queueMicrotask(() => {
+    persistScheduled = false;
+    saveToStorage(useNotificationStore.getState().notifications);
+  });
+}
+
 interface NotificationStore {
   notifications: Notification[];
   unreadCount: number;
@@ -51,9 +68,19 @@ interface NotificationStore {
 
 let counter = 0;
 
+function countUnread(notifications: Notification[]): number {
+  let unread = 0;
+  for (const n of notifications) {
+    if (!n.read) unread++;
+  }
+  return unread;
+}
+
+const initialNotifications = loadFromStorage();
+
 export const useNotificationStore = create<NotificationStore>((set, get) => ({
-  notifications: loadFromStorage(),
-  unreadCount: loadFromStorage().filter((n) => !n.read).length,
+  notifications: initialNotifications,
+  unreadCount: countUnread(initialNotifications),
 
   addNotification: (notification) => {
     const id = `notif-${++counter}-${Date.now()}`;
@@ -66,48 +93,50 @@ export const useNotificationStore = create<NotificationStore>((set, get) => ({
 
     set((state) => {
       const updated = [newNotification, ...state.notifications].slice(0, MAX_NOTIFICATIONS);
-      saveToStorage(updated);
+      // Only entries pushed past the cap can change the count besides the new one
+      const dropped = state.notifications.slice(MAX_NOTIFICATIONS - 1);
       return {
         notifications: updated,
-        unreadCount: updated.filter((n) => !n.read).length,
+        unreadCount: state.unreadCount + 1 - countUnread(dropped),
       };
     });
+    schedulePersist();
   },
 
   markAsRead: (id) => {
     set((state) => {
-      const updated = state.notifications.map((n) =>
-        n.id === id ? { ...n, read: true } : n,
-      );
-      saveToStorage(updated);
+      const target = state.notifications.find((n) => n.id === id);
+      if (!target || target.read) return state;
       return {
-        notifications: updated,
-        unreadCount: updated.filter((n) => !n.read).length,
+        notifications: state.notifications.map((n) => (n === target ? { ...n, read: true } : n)),
+        unreadCount: state.unreadCount - 1,
       };
     });
+    schedulePersist();
   },
 
   markAllAsRead: () => {
     set((state) => {
       const updated = state.notifications.map((n) => ({ ...n, read: true }));
-      saveToStorage(updated);
       return { notifications: updated, unreadCount: 0 };
     });
+    schedulePersist();
   },
 
   removeNotification: (id) => {
     set((state) => {
-      const updated = state.notifications.filter((n) => n.id !== id);
-      saveToStorage(updated);
+      const target = state.notifications.find((n) => n.id === id);
+      if (!target) return state;
       return {
-        notifications: updated,
-        unreadCount: updated.filter((n) => !n.read).length,
+        notifications: state.notifications.filter((n) => n !== target),
+        unreadCount: target.read ? state.unreadCount : state.unreadCount - 1,
       };
     });
+    schedulePersist();
   },
 
   clearAll: () => {
-    saveToStorage([]);
     set({ notifications: [], unreadCount: 0 });
+    schedulePersist();
   },
 }));
@@ -1,17 +1,48 @@
 // Hex encoding/decoding utilities
 
-export function hexToBytes(hex: string): Uint8Array {
-  const clean = hex.startsWith('0x') ? hex.slice(2) : hex;
-  if (clean.length % 2 !== 0) throw new Error('Invalid hex: odd length');
-  const bytes = new Uint8Array(clean.length / 2);
-  for (let i = 0; i < bytes.length; i++) {
-    bytes[i] = parseInt(clean.slice(i * 2, i * 2 + 2), 16);
+// Shared codec instances; both are stateless for one-shot calls
+const utf8Encoder = new TextEncoder();
+const utf8Decoder = new TextDecoder();
+
+// Map a single hex character code to its 4-bit value, or -1 if invalid
+function hexNibble(code: number): number {
+  if (code >= 48 && code <= 57) return code - 48; // 0-9
+  if (code >= 97 && code <= 102) return code - 87; // a-f
+  if (code >= 65 && code <= 70) return code - 55; // A-F
+  return -1;
+}
+
+// Decodes character codes straight into the output buffer and rejects
+// any non-hex character instead of letting parseInt turn it into 0x00
+export function hexToBytes(hex: string): Uint8Array<ArrayBuffer> {
+  const start = hex.startsWith('0x') ? 2 : 0;
+  const hexLen = hex.length - start;
+  if (hexLen % 2 !== 0) {
+    throw new Error('Hex string must have even length');
+  }
+  const bytes = new Uint8Array(hexLen / 2);
+  for (let i = 0, j = start; i < bytes.length; i++, j += 2) {
+    const hi = hexNibble(hex.charCodeAt(j));
+    const lo = hexNibble(hex.charCodeAt(j + 1));
+    if (hi < 0 || lo < 0) {
+      throw new Error(`Invalid hex character at position ${j}`);
+    }
+    bytes[i] = (hi << 4) | lo;
   }
   return bytes;
 }
 
+// Two-character hex strings for every byte value, built once at load
+const BYTE_TO_HEX: readonly string[] = Array.from({ length: 256 }, (_, b) =>
+  b.toString(16).padStart(2, '0'),
+);
+
 export function bytesToHex(bytes: Uint8Array): string {
-  return Array.from(bytes).map(b => b.toString(16).padStart(2, '0')).join('');
+  let hex = '';
+  for (let i = 0; i < bytes.length; i++) {
+    hex += BYTE_TO_HEX[bytes[i]!]!;
+  }
+  return hex;
 }
 
 export function addHexPrefix(hex: string): string {
@@ -26,11 +57,18 @@ export function isValidHex(hex: string): boolean {
   return /^[0-9a-fA-F]*$/.test(clean) && clean.length % 2 === 0;
 }
 
+export function utf8Encode(str: string): Uint8Array<ArrayBuffer> {
+  return utf8Encoder.encode(str);
+}
+export function utf8Decode(bytes: Uint8Array): string {
+  return utf8Decoder.decode(bytes);
+}
+
 export function hexToUtf8(hex: string): string {
-  return new TextDecoder().decode(hexToBytes(hex));
+  return utf8Decode(hexToBytes(hex));
 }
 export function utf8ToHex(str: string): string {
-  return bytesToHex(new TextEncoder().encode(str));
+  return bytesToHex(utf8Encode(str));
 }
 
 export function hexToBigInt(hex: string): bigint {
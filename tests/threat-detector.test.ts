@@ -143,6 +143,29 @@ describe("threat-detector contract", () => {
       expect(result.result).toBeOk(Cl.bool(true));
     });
 
+    it("maps score thresholds to threat levels", () => {
+      const cases: Array<[number, number]> = [
+        [0, 0], [24, 0], [25, 1], [49, 1], [50, 2],
+        [74, 2], [75, 3], [89, 3], [90, 4], [100, 4],
+      ];
+      cases.forEach(([score, level], i) => {
+        const campaignId = 300 + i;
+        simnet.callPublicFn(
+          CONTRACT,
+          "update-campaign-score",
+          [Cl.uint(campaignId), Cl.uint(score), Cl.uint(0), Cl.uint(0)],
+          deployer,
+        );
+        const result = simnet.callReadOnlyFn(
+          CONTRACT,
+          "get-threat-level",
+          [Cl.uint(campaignId)],
+          deployer,
+        );
+        expect(result.result).toBeUint(level);
+      });
+    });
+
     it("rejects score above 100", () => {
       const result = simnet.callPublicFn(
         CONTRACT,